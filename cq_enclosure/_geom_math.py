@@ -0,0 +1,36 @@
+def screw_points(
+    screw_width_loc: float,
+    screw_lenght_loc: float,
+    corner_screws: bool,
+    middle_length_screws: bool,
+    middle_width_screws: bool,
+) -> list[tuple[float, float]]:
+    # create a list with screw points
+    points = []
+    if corner_screws:
+        points.extend(
+            (
+                (screw_width_loc, screw_lenght_loc),
+                (-screw_width_loc, -screw_lenght_loc),
+                (screw_width_loc, -screw_lenght_loc),
+                (-screw_width_loc, screw_lenght_loc),
+            )
+        )
+
+    # add additional screw points along X axis
+    if middle_length_screws:
+        points.extend(((-screw_width_loc, 0), (screw_width_loc, 0)))
+
+    # add additional screw points along Y axis
+    if middle_width_screws:
+        points.extend(((0, -screw_lenght_loc), (0, screw_lenght_loc)))
+
+    return points
+
+
+def holder_holes_spread(
+    outer_length: float,
+    mount_holders_total_length: float,
+) -> float:
+    # place holes in the middle of holder parts sticking out of the box
+    return outer_length + (mount_holders_total_length - outer_length) / 2
@@ -1,5 +1,9 @@
+import functools
+import math
+
 import cadquery as cq
 
+from . import _geom_math as gm
 from .enclosure_parameters import (
     EnclosureParameters,
     ScrewLocation,
@@ -7,19 +11,33 @@ from .enclosure_parameters import (
     ScrewType,
 )
 
+# vertical edges selector shared by builders
+_VERTICAL_EDGES = cq.StringSyntaxSelector("|Z")
+
+# gasket fillets smaller than this are skipped
+_GASKET_FILLET_TOLERANCE = 1e-3
+
+# countersink angle of screw holes in the lid, in degrees
+_CSK_ANGLE = 82
+
 
 def build_box(p: EnclosureParameters) -> cq.Workplane:
     # create box using outer dimensions
     box = (
         cq.Workplane("XY")
+        .tag("bottom")
         .rect(p.box_outer_width, p.box_outer_length)
         .extrude(p.box_outer_height)
+        # tag top plane once, it is reused by builders until the box is split
+        .faces(">Z")
+        .workplane()
+        .tag("top")
     )
 
     # cut inner space in box
     box = (
-        box.faces("<Z")
-        .workplane(invert=True, offset=p.bottom_and_lid_thickness)
+        box.workplaneFromTagged("bottom")
+        .workplane(offset=p.bottom_and_lid_thickness)
         .rect(p.box_inner_width, p.box_inner_length)
         .cutBlind(p.box_inner_height)
     )
@@ -27,46 +45,49 @@ def build_box(p: EnclosureParameters) -> cq.Workplane:
     return box
 
 
-def compute_screw_points(p: EnclosureParameters) -> list[tuple[float, float]]:
-    match p.screw_location:
-        case ScrewLocation.INSIDE_BOX:
-            screw_width_loc = (
-                p.box_inner_width / 2 - p.screw_cylinder_radius + p.wall_thickness
-            )
-            screw_lenght_loc = (
-                p.box_inner_length / 2 - p.screw_cylinder_radius + p.wall_thickness
-            )
-        case ScrewLocation.OUTSIDE_BOX:
-            screw_width_loc = (
-                p.box_outer_width / 2 + p.screw_cylinder_radius - p.wall_thickness
-            )
-            screw_lenght_loc = (
-                p.box_outer_length / 2 + p.screw_cylinder_radius - p.wall_thickness
-            )
-        case _:
-            raise ValueError("Invalid screws location.")
+def _screw_locations_inside(p: EnclosureParameters) -> tuple[float, float]:
+    screw_width_loc = p.box_inner_width / 2 - p.screw_cylinder_radius + p.wall_thickness
+    screw_lenght_loc = (
+        p.box_inner_length / 2 - p.screw_cylinder_radius + p.wall_thickness
+    )
+    return screw_width_loc, screw_lenght_loc
 
-    # create a list with screw points
-    screw_points = []
-    if p.corner_screws:
-        screw_points.extend(
-            (
-                (screw_width_loc, screw_lenght_loc),
-                (-screw_width_loc, -screw_lenght_loc),
-                (screw_width_loc, -screw_lenght_loc),
-                (-screw_width_loc, screw_lenght_loc),
-            )
-        )
 
-    # add additional screw points along X axis
-    if p.middle_length_screws:
-        screw_points.extend(((-screw_width_loc, 0), (screw_width_loc, 0)))
+def _screw_locations_outside(p: EnclosureParameters) -> tuple[float, float]:
+    screw_width_loc = p.box_outer_width / 2 + p.screw_cylinder_radius - p.wall_thickness
+    screw_lenght_loc = (
+        p.box_outer_length / 2 + p.screw_cylinder_radius - p.wall_thickness
+    )
+    return screw_width_loc, screw_lenght_loc
+
 
-    # add additional screw points along Y axis
-    if p.middle_width_screws:
-        screw_points.extend(((0, -screw_lenght_loc), (0, screw_lenght_loc)))
+_SCREW_LOCATIONS_DISPATCH = {
+    ScrewLocation.INSIDE_BOX: _screw_locations_inside,
+    ScrewLocation.OUTSIDE_BOX: _screw_locations_outside,
+}
 
-    return screw_points
+
+def compute_screw_locations(p: EnclosureParameters) -> tuple[float, float]:
+    if p.screw_location not in _SCREW_LOCATIONS_DISPATCH:
+        raise ValueError("Invalid screws location.")
+
+    return _SCREW_LOCATIONS_DISPATCH[p.screw_location](p)
+
+
+def compute_screw_points(
+    p: EnclosureParameters,
+) -> tuple[list[tuple[float, float]], float, float]:
+    screw_width_loc, screw_lenght_loc = compute_screw_locations(p)
+
+    screw_points = gm.screw_points(
+        screw_width_loc,
+        screw_lenght_loc,
+        p.corner_screws,
+        p.middle_length_screws,
+        p.middle_width_screws,
+    )
+
+    return screw_points, screw_width_loc, screw_lenght_loc
 
 
 def build_screw_cylinders(
@@ -76,7 +97,7 @@ def build_screw_cylinders(
 ) -> cq.Workplane:
     # add base screw cylinders
     box = (
-        box.faces(">Z")
+        box.workplaneFromTagged("top")
         .workplane(invert=True)
         .pushPoints(screw_points)
         .circle(p.screw_cylinder_radius)
@@ -86,48 +107,40 @@ def build_screw_cylinders(
     return box
 
 
-def instantiate_selectors(p: EnclosureParameters):
-    # create inner edges selector
-    inner_edges_selector = cq.selectors.BoxSelector(
-        (-p.box_inner_width / 2 - 1, -p.box_inner_length / 2 - 1, -1),
-        (p.box_inner_width / 2 + 1, p.box_inner_length / 2 + 1, p.box_inner_height + 1),
-    )
-
-    # create outer edges selector
-    outer_edges_selector = cq.selectors.BoxSelector(
-        (-p.box_outer_width / 2 - 1e-3, -p.box_outer_length / 2 - 1e-3, -1),
-        (
-            p.box_outer_width / 2 + 1e-3,
-            p.box_outer_length / 2 + 1e-3,
-            p.box_inner_height + 1,
-        ),
-    )
-    outer_edges_selector = cq.selectors.InverseSelector(outer_edges_selector)
-
+@functools.lru_cache(maxsize=32)
+def _build_selectors(
+    box_inner_width: float,
+    box_inner_length: float,
+    box_outer_width: float,
+    box_outer_length: float,
+    box_outer_height: float,
+    cut_top: float,
+    gasket_height: float,
+) -> cq.Selector:
     # setup gasket edges selector
     gasket_edges_selector_outer = cq.selectors.BoxSelector(
         (
-            p.box_outer_width / 2 - 1e-3,
-            p.box_outer_length / 2 - 1e-3,
-            p.box_outer_height - p.cut_top - p.gasket_height * 2,
+            box_outer_width / 2 - 1e-3,
+            box_outer_length / 2 - 1e-3,
+            box_outer_height - cut_top - gasket_height * 2,
         ),
         (
-            -p.box_outer_width / 2 + 1e-3,
-            -p.box_outer_length / 2 + 1e-3,
-            p.box_outer_height - p.cut_top + p.gasket_height * 2,
+            -box_outer_width / 2 + 1e-3,
+            -box_outer_length / 2 + 1e-3,
+            box_outer_height - cut_top + gasket_height * 2,
         ),
     )
 
     gasket_edges_selector_inner = cq.selectors.BoxSelector(
         (
-            p.box_inner_width / 2 + 1e-3,
-            p.box_inner_length / 2 + 1e-3,
-            p.box_outer_height - p.cut_top - p.gasket_height * 2,
+            box_inner_width / 2 + 1e-3,
+            box_inner_length / 2 + 1e-3,
+            box_outer_height - cut_top - gasket_height * 2,
         ),
         (
-            -p.box_inner_width / 2 - 1e-3,
-            -p.box_inner_length / 2 - 1e-3,
-            p.box_outer_height - p.cut_top + p.gasket_height * 2,
+            -box_inner_width / 2 - 1e-3,
+            -box_inner_length / 2 - 1e-3,
+            box_outer_height - cut_top + gasket_height * 2,
         ),
     )
 
@@ -135,47 +148,30 @@ def instantiate_selectors(p: EnclosureParameters):
         gasket_edges_selector_outer, gasket_edges_selector_inner
     )
 
-    return (
-        inner_edges_selector,
-        outer_edges_selector,
-        gasket_edges_selector,
+    return gasket_edges_selector
+
+
+def instantiate_selectors(p: EnclosureParameters) -> cq.Selector:
+    # selectors are stateless, so they can be shared between builds with same dimensions
+    return _build_selectors(
+        p.box_inner_width,
+        p.box_inner_length,
+        p.box_outer_width,
+        p.box_outer_length,
+        p.box_outer_height,
+        p.cut_top,
+        p.gasket_height,
     )
 
 
 def fillet_box(
     p: EnclosureParameters,
     box: cq.Workplane,
-    inner_edges_selector: cq.Selector,
 ) -> cq.Workplane:
-    match p.screw_location:
-        case ScrewLocation.OUTSIDE_BOX:
-            # fillet screw hole cylinders
-            box = box.edges(
-                cq.selectors.SubtractSelector(
-                    cq.StringSyntaxSelector("|Z"), inner_edges_selector
-                )
-            ).fillet(p.screw_cylinder_fillet)
-
-            # fillet inner edges
-            box = box.edges("|Z").edges(inner_edges_selector).fillet(p.inner_fillet)
-        case ScrewLocation.INSIDE_BOX:
-            # fillet screw hole cylinders
-            box = (
-                box.edges("|Z")
-                .edges(inner_edges_selector)
-                .fillet(p.screw_cylinder_fillet)
-            )
+    # fillet screw cylinders, inner and outer vertical edges in one pass
+    box = box.edges(_VERTICAL_EDGES).fillet(p.vertical_edges_fillet)
 
-            # fillet outer vertical edges
-            box = box.edges(
-                cq.selectors.SubtractSelector(
-                    cq.StringSyntaxSelector("|Z"), inner_edges_selector
-                )
-            ).fillet(p.outer_vertical_edges_fillet)
-        case _:
-            raise ValueError("Invalid screws location.")
-
-    if p.fillet_top:
+    if p.fillet_top and not p.preview_mode:
         # fillet top of the lid
         box = (
             box.faces(">Z")
@@ -183,39 +179,111 @@ def fillet_box(
             .fillet(p.bottom_lid_fillet - 1e-2)
         )
 
-    if p.fillet_bottom and p.mount_holders is False:
+    if p.fillet_bottom and p.mount_holders is False and not p.preview_mode:
         # fillet bottom of the box
         box = box.faces("<Z").fillet(p.bottom_lid_fillet)
 
     return box
 
 
+def _screw_hole_tool(p: EnclosureParameters) -> cq.Solid:
+    # mirrors cskHole in the lid + hole below it, fused into a single tool
+    # so screw holes are cut from the box in one boolean operation
+    bore_dir = cq.Vector(0, 0, -1)
+    center = cq.Vector()
+    lid_hole = cq.Solid.makeCylinder(
+        p.lid_screw_hole_diameter / 2, p.cut_top, center, bore_dir
+    )
+    csk_radius = p.screw_head_diameter / 2
+    csk = cq.Solid.makeCone(
+        csk_radius,
+        0.0,
+        csk_radius / math.tan(math.radians(_CSK_ANGLE / 2)),
+        center,
+        bore_dir,
+    )
+    screw_hole = cq.Solid.makeCylinder(
+        p.screw_hole_diameter / 2, p.screw_total_length, center, bore_dir
+    )
+
+    return screw_hole.fuse(lid_hole, csk)
+
+
 def create_screw_holes(
     p: EnclosureParameters,
     box: cq.Workplane,
     screw_points: list[tuple[float, float]],
 ) -> cq.Workplane:
+    screw_hole = _screw_hole_tool(p)
+
     # create screw holes in screw cylinders
     box = (
-        box.faces(">Z")
-        .workplane()
+        box.workplaneFromTagged("top")
         .pushPoints(screw_points)
-        .cskHole(p.lid_screw_hole_diameter, p.screw_head_diameter, 82, p.cut_top)
+        .cutEach(lambda loc: screw_hole.moved(loc), True)
+    )
+
+    return box
+
+
+def _nut_wa_cut_rect_spaces(
+    p: EnclosureParameters,
+    box: cq.Workplane,
+    screw_points: list[tuple[float, float]],
+) -> cq.Workplane:
+    # build both spaces first and cut them from the box at once
+    narrow_spaces = (
+        box.workplaneFromTagged("base_plane")
+        .workplane(invert=True)
         .pushPoints(screw_points)
-        .hole(p.screw_hole_diameter, p.screw_total_length)
+        .rect(p.square_nut_width, p.screw_hole_diameter)
+        .extrude(p.layer_height, combine=False)
     )
+    square_spaces = (
+        box.workplaneFromTagged("base_plane")
+        .workplane(offset=p.layer_height, invert=True)
+        .pushPoints(screw_points)
+        .rect(p.screw_hole_diameter, p.screw_hole_diameter)
+        .extrude(p.layer_height, combine=False)
+    )
+    box = box.cut(narrow_spaces.add(square_spaces))
 
     return box
 
 
+def _nut_wa_add_ceiling(
+    p: EnclosureParameters,
+    box: cq.Workplane,
+    screw_points: list[tuple[float, float]],
+) -> cq.Workplane:
+    box = (
+        box.workplaneFromTagged("base_plane")
+        .workplane(invert=True)
+        .pushPoints(screw_points)
+        .rect(p.square_nut_width, p.square_nut_width)
+        .extrude(p.layer_height)
+    )
+
+    return box
+
+
+_NUT_WA_DISPATCH = {
+    NutPrintingWA.CUT_RECT_SPACES: _nut_wa_cut_rect_spaces,
+    NutPrintingWA.ADD_CEILING: _nut_wa_add_ceiling,
+}
+
+
 def create_square_nut_holes(
     p: EnclosureParameters,
     box: cq.Workplane,
     screw_points: list[tuple[float, float]],
 ) -> cq.Workplane:
+    if p.nut_wa_type not in _NUT_WA_DISPATCH:
+        raise ValueError("Invalid nut_wa_type.")
+
     # create square nut holes
     box = (
-        box.faces(">Z")
+        box.workplaneFromTagged("top")
         .workplane(offset=p.square_nut_depth_placement, invert=True)
         .tag("base_plane")
         .pushPoints(screw_points)
@@ -223,30 +291,7 @@ def create_square_nut_holes(
         .cutBlind(p.square_nut_height)
     )
 
-    match p.nut_wa_type:
-        case NutPrintingWA.CUT_RECT_SPACES:
-            box = (
-                box.workplaneFromTagged("base_plane")
-                .workplane(invert=True)
-                .pushPoints(screw_points)
-                .rect(p.square_nut_width, p.screw_hole_diameter)
-                .cutBlind(p.layer_height)
-                .workplaneFromTagged("base_plane")
-                .workplane(offset=p.layer_height, invert=True)
-                .pushPoints(screw_points)
-                .rect(p.screw_hole_diameter, p.screw_hole_diameter)
-                .cutBlind(p.layer_height)
-            )
-        case NutPrintingWA.ADD_CEILING:
-            box = (
-                box.workplaneFromTagged("base_plane")
-                .workplane(invert=True)
-                .pushPoints(screw_points)
-                .rect(p.square_nut_width, p.square_nut_width)
-                .extrude(p.layer_height)
-            )
-        case _:
-            raise ValueError("Invalid nut_wa_type.")
+    box = _NUT_WA_DISPATCH[p.nut_wa_type](p, box, screw_points)
 
     return box
 
@@ -257,8 +302,9 @@ def split_box(
 ) -> tuple[cq.Workplane, cq.Workplane]:
     # split model into box and lid
     lid, box = (
-        box.faces(">Z")
+        box.workplaneFromTagged("top")
         .workplane(offset=-p.cut_top)
+        .tag("split")
         .split(keepTop=True, keepBottom=True)
         .all()
     )
@@ -266,44 +312,79 @@ def split_box(
     return box, lid
 
 
+def compute_gasket_hole_radii(
+    p: EnclosureParameters,
+) -> tuple[float, float, float, float]:
+    # radii of gasket rings around screw holes, centered between hole and cylinder
+    screw_ring_center = (
+        p.box_screw_hole_radius
+        + (p.screw_cylinder_radius - p.box_screw_hole_radius) / 2
+    )
+
+    slot_outer_radius = screw_ring_center + p.gasket_slot_width / 2
+    slot_inner_radius = screw_ring_center - p.gasket_slot_width / 2
+    gasket_outer_radius = screw_ring_center + p.gasket_width / 2
+    gasket_inner_radius = screw_ring_center - p.gasket_width / 2
+
+    return (
+        slot_outer_radius,
+        slot_inner_radius,
+        gasket_outer_radius,
+        gasket_inner_radius,
+    )
+
+
+def _has_face_smaller_than(faces: list, threshold: float) -> bool:
+    # stop at first small face, computing face area is expensive
+    return any(face.Area() < threshold for face in faces)  # type: ignore
+
+
+def _has_wire_shorter_than(wires: list, threshold: float) -> bool:
+    for wire in wires:
+        wire_length = 0.0
+        for edge in wire:  # type: ignore
+            wire_length += edge.Length()
+            # stop measuring wire as soon as it is long enough
+            if wire_length >= threshold:
+                break
+        else:
+            return True
+
+    return False
+
+
 def create_gasket_slot(
     p: EnclosureParameters,
     box: cq.Workplane,
     screw_points: list[tuple[float, float]],
+    slot_outer_radius: float,
+    slot_inner_radius: float,
 ) -> cq.Workplane:
+    base_plane = box.workplaneFromTagged("split").workplane(invert=True)
+
     # create gasket slot in a box
-    box = (
-        box.faces(">Z")
-        .workplane(invert=True)
-        .rect(p.gasket_slot_outer_width, p.gasket_slot_outer_length)
+    gasket_slot = (
+        base_plane.rect(p.gasket_slot_outer_width, p.gasket_slot_outer_length)
         .rect(p.gasket_slot_inner_width, p.gasket_slot_inner_length)
-        .cutBlind(p.gasket_slot_depth)
+        .extrude(p.gasket_slot_depth, combine=False)
     )
 
     if p.screw_location == ScrewLocation.INSIDE_BOX:
-        gasket_slot_hole_outer_radius = (
-            p.box_screw_hole_radius
-            + (p.screw_cylinder_radius - p.box_screw_hole_radius + p.gasket_slot_width)
-            / 2
-        )
-        gasket_slot_hole_inner_radius = (
-            p.box_screw_hole_radius
-            + (p.screw_cylinder_radius - p.box_screw_hole_radius - p.gasket_slot_width)
-            / 2
-        )
         # create gasket holes around screw holes in cylinders
-        box = (
-            box.faces(">Z")
-            .workplane(invert=True)
-            .pushPoints(screw_points)
-            .circle(gasket_slot_hole_outer_radius)
-            .circle(gasket_slot_hole_inner_radius)
-            .cutBlind(p.gasket_slot_depth)
+        gasket_slot = gasket_slot.add(
+            base_plane.pushPoints(screw_points)
+            .circle(slot_outer_radius)
+            .circle(slot_inner_radius)
+            .extrude(p.gasket_slot_depth, combine=False)
         )
 
+    # cut rectangular and circular slots at once
+    box = base_plane.cut(gasket_slot)
+
+    if p.screw_location == ScrewLocation.INSIDE_BOX:
         # make sure there is a tiny space to remove between rectangular gasket slot and circular ones
         faces = box.faces(">Z").faces(cq.selectors.AreaNthSelector(0)).vals()
-        if min(face.Area() for face in faces) < p.screw_hole_diameter**1.5:  # type: ignore
+        if _has_face_smaller_than(faces, p.screw_hole_diameter**1.5):
             box = (
                 box.faces(">Z")
                 .faces(cq.selectors.AreaNthSelector(0))
@@ -319,40 +400,36 @@ def create_gasket_press(
     p: EnclosureParameters,
     lid: cq.Workplane,
     screw_points: list[tuple[float, float]],
+    gasket_outer_radius: float,
+    gasket_inner_radius: float,
 ) -> cq.Workplane:
+    base_plane = lid.workplaneFromTagged("split").workplane(invert=True)
+
     # create gasket press on a lid
-    lid = (
-        lid.faces("<Z")
-        .workplane()
-        .tag("base_plane")
-        .rect(p.gasket_outer_width, p.gasket_outer_length)
+    gasket_press = (
+        base_plane.rect(p.gasket_outer_width, p.gasket_outer_length)
         .rect(p.gasket_inner_width, p.gasket_inner_length)
-        .extrude(p.gasket_press_height)
+        .extrude(p.gasket_press_height, combine=False)
     )
 
     if p.screw_location == ScrewLocation.INSIDE_BOX:
         # create gasket press around holes
-        lid = (
-            lid.workplaneFromTagged("base_plane")
-            .pushPoints(screw_points)
-            .circle(
-                p.box_screw_hole_radius
-                + (p.screw_cylinder_radius - p.box_screw_hole_radius + p.gasket_width)
-                / 2
-            )
-            .circle(
-                p.box_screw_hole_radius
-                + (p.screw_cylinder_radius - p.box_screw_hole_radius - p.gasket_width)
-                / 2
-            )
-            .extrude(p.gasket_press_height)
+        gasket_press = gasket_press.add(
+            base_plane.pushPoints(screw_points)
+            .circle(gasket_outer_radius)
+            .circle(gasket_inner_radius)
+            .extrude(p.gasket_press_height, combine=False)
         )
+
+    # add rectangular and circular presses at once
+    lid = base_plane.union(gasket_press)
+
+    if p.screw_location == ScrewLocation.INSIDE_BOX:
         # fill space remaining between gasket press around holes and rectangular one
         # make sure there is a tiny space to remove between rectangular gasket slot and circular ones
         # check area of all faces due to cadquery non-deterministic buggy behaviour
-        if (
-            min(face.Area() for face in lid.faces("<Z[2]").vals())  # type: ignore
-            < p.screw_hole_diameter**1.5
+        if _has_face_smaller_than(
+            lid.faces("<Z[2]").vals(), p.screw_hole_diameter**1.5
         ):
             lid = (
                 lid.faces("<Z[2]")
@@ -365,7 +442,10 @@ def create_gasket_press(
 
 
 def build_gasket(
-    p: EnclosureParameters, screw_points: list[tuple[float, float]]
+    p: EnclosureParameters,
+    screw_points: list[tuple[float, float]],
+    gasket_outer_radius: float,
+    gasket_inner_radius: float,
 ) -> cq.Workplane:
     # create gasket
     gasket = (
@@ -381,26 +461,13 @@ def build_gasket(
             gasket.faces("<Z")
             .workplane(invert=True)
             .pushPoints(screw_points)
-            .circle(
-                p.box_screw_hole_radius
-                + (p.screw_cylinder_radius - p.box_screw_hole_radius + p.gasket_width)
-                / 2
-            )
-            .circle(
-                p.box_screw_hole_radius
-                + (p.screw_cylinder_radius - p.box_screw_hole_radius - p.gasket_width)
-                / 2
-            )
+            .circle(gasket_outer_radius)
+            .circle(gasket_inner_radius)
             .extrude(p.gasket_height)
         )
 
-        min_wire_len = min(
-            sum(edge.Length() for edge in wire)  # type: ignore
-            for wire in gasket.faces("<Z")
-            .wires(cq.selectors.LengthNthSelector(0))
-            .vals()
-        )
-        if min_wire_len < p.screw_hole_diameter**1.5:  # type: ignore
+        wires = gasket.faces("<Z").wires(cq.selectors.LengthNthSelector(0)).vals()
+        if _has_wire_shorter_than(wires, p.screw_hole_diameter**1.5):
             gasket = (
                 gasket.faces("<Z")
                 .wires(cq.selectors.LengthNthSelector(0))
@@ -411,31 +478,59 @@ def build_gasket(
     return gasket
 
 
-def apply_gasket_fillets(
+def fillet_gasket_slot(
     p: EnclosureParameters,
     box: cq.Workplane,
-    lid: cq.Workplane,
-    gasket: cq.Workplane,
     gasket_edges_selector: cq.Selector,
-) -> tuple[cq.Workplane, cq.Workplane, cq.Workplane]:
+) -> cq.Workplane:
+    if p.gasket_fillet < _GASKET_FILLET_TOLERANCE:
+        return box
+
     # fillet gasket slot
-    box = box.edges("|Z").edges(gasket_edges_selector).fillet(p.gasket_fillet)
+    box = (
+        box.edges(_VERTICAL_EDGES).edges(gasket_edges_selector).fillet(p.gasket_fillet)
+    )
+
+    return box
+
+
+def fillet_gasket_press(
+    p: EnclosureParameters,
+    lid: cq.Workplane,
+    gasket_edges_selector: cq.Selector,
+) -> cq.Workplane:
+    if p.gasket_fillet < _GASKET_FILLET_TOLERANCE:
+        return lid
+
     # fillet gasket press
-    lid = lid.edges("|Z").edges(gasket_edges_selector).fillet(p.gasket_fillet)
+    lid = (
+        lid.edges(_VERTICAL_EDGES).edges(gasket_edges_selector).fillet(p.gasket_fillet)
+    )
+
+    return lid
+
+
+def fillet_gasket(
+    p: EnclosureParameters,
+    gasket: cq.Workplane,
+) -> cq.Workplane:
+    if p.gasket_fillet < _GASKET_FILLET_TOLERANCE:
+        return gasket
+
     # fillet gasket
-    gasket = gasket.edges("|Z").fillet(p.gasket_fillet)
+    gasket = gasket.edges(_VERTICAL_EDGES).fillet(p.gasket_fillet)
 
-    return box, lid, gasket
+    return gasket
 
 
 def build_mount_holders(
     p: EnclosureParameters,
     box: cq.Workplane,
+    screw_lenght_loc: float,
 ) -> cq.Workplane:
     # create holder base
     box = (
-        box.faces("<Z")
-        .workplane(invert=True)
+        box.workplaneFromTagged("bottom")
         .rect(p.box_outer_width / 2, p.mount_holders_total_length)
         .extrude(p.bottom_and_lid_thickness)
     )
@@ -453,29 +548,22 @@ def build_mount_holders(
     if p.mount_holders_fillet:
         # fillet holder edges
         box = (
-            box.edges("|Z")
+            box.edges(_VERTICAL_EDGES)
             .edges(mount_holder_selector)
             .fillet(p.mount_holders_fillet_radius)
         )
 
-    # fillet bottom of the box
-    box = box.faces("<Z").fillet(p.bottom_lid_fillet)
+    if not p.preview_mode:
+        # fillet bottom of the box
+        box = box.faces("<Z").fillet(p.bottom_lid_fillet)
 
     # create holder screw holes
     outer_len_with_cylinders = p.box_outer_length
     if p.middle_width_screws and p.screw_location == ScrewLocation.OUTSIDE_BOX:
-        screw_lenght_loc = (
-            p.box_outer_length / 2 + p.screw_cylinder_radius - p.wall_thickness
-        )
         outer_len_with_cylinders = (screw_lenght_loc + p.screw_cylinder_radius) * 2
-        holder_holes_spread = (
-            outer_len_with_cylinders
-            + (p.mount_holders_total_length - outer_len_with_cylinders) / 2
-        )
-    else:
-        holder_holes_spread = (
-            p.box_outer_length + (p.mount_holders_total_length - p.box_outer_length) / 2
-        )
+    holder_holes_spread = gm.holder_holes_spread(
+        outer_len_with_cylinders, p.mount_holders_total_length
+    )
     box = (
         box.faces("<Z[-2]")
         .workplane()
@@ -1,3 +1,7 @@
+from pathlib import Path
+import functools
+import hashlib
+
 import cadquery as cq
 
 from . import builders as bld
@@ -8,7 +12,87 @@ from .enclosure_parameters import (
 )
 
 
+def _finish_box(
+    p: EnclosureParameters,
+    box: cq.Workplane,
+    screw_points: list[tuple[float, float]],
+    slot_outer_radius: float,
+    slot_inner_radius: float,
+    gasket_edges_selector: cq.Selector,
+    screw_lenght_loc: float,
+) -> cq.Workplane:
+    box = bld.create_gasket_slot(
+        p, box, screw_points, slot_outer_radius, slot_inner_radius
+    )
+    box = bld.fillet_gasket_slot(p, box, gasket_edges_selector)
+
+    if p.mount_holders:
+        box = bld.build_mount_holders(p, box, screw_lenght_loc)
+
+    return box
+
+
+def _finish_lid(
+    p: EnclosureParameters,
+    lid: cq.Workplane,
+    screw_points: list[tuple[float, float]],
+    gasket_outer_radius: float,
+    gasket_inner_radius: float,
+    gasket_edges_selector: cq.Selector,
+) -> cq.Workplane:
+    lid = bld.create_gasket_press(
+        p, lid, screw_points, gasket_outer_radius, gasket_inner_radius
+    )
+    lid = bld.fillet_gasket_press(p, lid, gasket_edges_selector)
+
+    return lid
+
+
+def _finish_gasket(
+    p: EnclosureParameters,
+    screw_points: list[tuple[float, float]],
+    gasket_outer_radius: float,
+    gasket_inner_radius: float,
+) -> cq.Workplane:
+    gasket = bld.build_gasket(p, screw_points, gasket_outer_radius, gasket_inner_radius)
+    gasket = bld.fillet_gasket(p, gasket)
+
+    return gasket
+
+
+@functools.cache
+def _source_hash() -> bytes:
+    # builders changes must invalidate parts cached by older code
+    sources = sorted(Path(__file__).parent.glob("*.py"))
+    return hashlib.blake2b(
+        b"".join(path.read_bytes() for path in sources), digest_size=16
+    ).digest()
+
+
 class Enclosure(EnclosureParameters):
+    def cache_key(self) -> str:
+        # call before build, initialize modifies parameters
+        return hashlib.blake2b(
+            _source_hash() + self.model_dump_json().encode(), digest_size=16
+        ).hexdigest()
+
+    def preview(self) -> cq.Workplane:
+        # rough single solid for quick visual feedback, skips fillets, split and gasket
+        # works on a copy, initialize modifies parameters used later by build
+        p = self.model_copy()
+        p.initialize()
+
+        p.validate()
+
+        screw_points, _, _ = bld.compute_screw_points(p)
+
+        box = bld.build_box(p)
+
+        box = bld.build_screw_cylinders(p, box, screw_points)
+        box = bld.create_screw_holes(p, box, screw_points)
+
+        return box
+
     def build(
         self,
     ) -> tuple[cq.Workplane, cq.Workplane, cq.Workplane]:
@@ -18,33 +102,45 @@ class Enclosure(EnclosureParameters):
         # check parameters
         self.validate()
 
+        gasket_edges_selector = bld.instantiate_selectors(self)
+        screw_points, _, screw_lenght_loc = bld.compute_screw_points(self)
         (
-            inner_edges_selector,
-            outer_edges_selector,
-            gasket_edges_selector,
-        ) = bld.instantiate_selectors(self)
-        screw_points = bld.compute_screw_points(self)
+            slot_outer_radius,
+            slot_inner_radius,
+            gasket_outer_radius,
+            gasket_inner_radius,
+        ) = bld.compute_gasket_hole_radii(self)
 
         box = bld.build_box(self)
 
         box = bld.build_screw_cylinders(self, box, screw_points)
         box = bld.create_screw_holes(self, box, screw_points)
-        box = bld.fillet_box(self, box, inner_edges_selector)
+        box = bld.fillet_box(self, box)
 
         if self.screw_type == ScrewType.WITH_SQUARE_NUT:
             box = bld.create_square_nut_holes(self, box, screw_points)
 
         box, lid = bld.split_box(self, box)
 
-        box = bld.create_gasket_slot(self, box, screw_points)
-        lid = bld.create_gasket_press(self, lid, screw_points)
-        gasket = bld.build_gasket(self, screw_points)
-
-        box, lid, gasket = bld.apply_gasket_fillets(
-            self, box, lid, gasket, gasket_edges_selector
+        box = _finish_box(
+            self,
+            box,
+            screw_points,
+            slot_outer_radius,
+            slot_inner_radius,
+            gasket_edges_selector,
+            screw_lenght_loc,
+        )
+        lid = _finish_lid(
+            self,
+            lid,
+            screw_points,
+            gasket_outer_radius,
+            gasket_inner_radius,
+            gasket_edges_selector,
+        )
+        gasket = _finish_gasket(
+            self, screw_points, gasket_outer_radius, gasket_inner_radius
         )
-
-        if self.mount_holders:
-            box = bld.build_mount_holders(self, box)
 
         return box, lid, gasket
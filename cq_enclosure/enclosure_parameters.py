@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import cached_property
 from pydantic import BaseModel
 import math
 
@@ -54,6 +55,8 @@ class EnclosureParameters(BaseModel):
     gasket_width: float = 1.2
     gasket_spacing: float = 0.15
     gasket_compression: float = 0.2
+    # set to 0 to skip gasket fillets, e.g. for quick previews
+    gasket_fillet: float = 2.0 + 4 * 1e-3
 
     # mount holders
     mount_holders: bool = True
@@ -67,6 +70,23 @@ class EnclosureParameters(BaseModel):
 
     fillet_bottom: bool = True
     fillet_top: bool = True
+    # skip top and bottom fillets for faster builds
+    preview_mode: bool = False
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # derived values are cached, drop them whenever a parameter changes
+        self.invalidate_cache()
+
+    def model_copy(self, *, update=None, deep=False):
+        # pydantic writes updated fields directly into __dict__, bypassing __setattr__
+        copy = super().model_copy(update=update, deep=deep)
+        copy.invalidate_cache()
+        return copy
+
+    def invalidate_cache(self):
+        for name in _CACHED_PROPERTIES:
+            self.__dict__.pop(name, None)
 
     def initialize(self):
         self.square_nut_width += 0.4
@@ -135,35 +155,23 @@ class EnclosureParameters(BaseModel):
             )
 
     # enclosure wall thickness
-    @property
+    @cached_property
     def wall_thickness(self) -> float:
         return 3.0
 
-    @property
+    @cached_property
     def bottom_and_lid_thickness(self) -> float:
         return 2.0
 
-    @property
-    def screw_cylinder_fillet(self) -> float:
-        return 2.0 + 1e-3
-
-    @property
-    def inner_fillet(self) -> float:
-        return 2.0 + 2 * 1e-3
+    @cached_property
+    def vertical_edges_fillet(self) -> float:
+        return 2.0
 
-    @property
+    @cached_property
     def bottom_lid_fillet(self) -> float:
         return 1.0
 
-    @property
-    def outer_vertical_edges_fillet(self) -> float:
-        return 2.0 + 1e-3
-
-    @property
-    def gasket_fillet(self) -> float:
-        return 2.0 + 4 * 1e-3
-
-    @property
+    @cached_property
     def screw_cylinder_radius(self) -> float:
         base_radius = max(self.screw_hole_diameter, 3.0)
         if self.screw_type == ScrewType.WITH_SQUARE_NUT:
@@ -171,35 +179,35 @@ class EnclosureParameters(BaseModel):
             base_radius = max(nut_radius, base_radius)
         return base_radius + 1.6
 
-    @property
+    @cached_property
     def square_nut_depth_placement(self) -> float:
         return self.screw_total_length - 4.0
 
-    @property
+    @cached_property
     def lid_screw_hole_diameter(self) -> float:
         return self.screw_hole_diameter + 1.0
 
-    @property
+    @cached_property
     def box_screw_hole_radius(self) -> float:
         return self.screw_hole_diameter / 2
 
-    @property
+    @cached_property
     def box_outer_width(self) -> float:
         return self.box_inner_width + 2 * self.wall_thickness
 
-    @property
+    @cached_property
     def box_outer_length(self) -> float:
         return self.box_inner_length + 2 * self.wall_thickness
 
-    @property
+    @cached_property
     def box_outer_height(self) -> float:
         return self.box_inner_height + 2 * self.bottom_and_lid_thickness
 
-    @property
+    @cached_property
     def gasket_in_slot_distance(self) -> float:
         return self.gasket_spacing * 2
 
-    @property
+    @cached_property
     def gasket_slot_outer_width(self) -> float:
         return (
             self.box_outer_width
@@ -208,7 +216,7 @@ class EnclosureParameters(BaseModel):
             + self.gasket_in_slot_distance
         )
 
-    @property
+    @cached_property
     def gasket_slot_outer_length(self) -> float:
         return (
             self.box_outer_length
@@ -217,7 +225,7 @@ class EnclosureParameters(BaseModel):
             + self.gasket_in_slot_distance
         )
 
-    @property
+    @cached_property
     def gasket_slot_inner_width(self) -> float:
         return (
             self.box_outer_width
@@ -226,7 +234,7 @@ class EnclosureParameters(BaseModel):
             - self.gasket_in_slot_distance
         )
 
-    @property
+    @cached_property
     def gasket_slot_inner_length(self) -> float:
         return (
             self.box_outer_length
@@ -235,38 +243,45 @@ class EnclosureParameters(BaseModel):
             - self.gasket_in_slot_distance
         )
 
-    @property
+    @cached_property
     def gasket_outer_width(self) -> float:
         return self.gasket_slot_outer_width - self.gasket_in_slot_distance
 
-    @property
+    @cached_property
     def gasket_outer_length(self) -> float:
         return self.gasket_slot_outer_length - self.gasket_in_slot_distance
 
-    @property
+    @cached_property
     def gasket_inner_width(self) -> float:
         return self.gasket_slot_inner_width + self.gasket_in_slot_distance
 
-    @property
+    @cached_property
     def gasket_inner_length(self) -> float:
         return self.gasket_slot_inner_length + self.gasket_in_slot_distance
 
-    @property
+    @cached_property
     def gasket_slot_width(self) -> float:
         return self.gasket_width + self.gasket_in_slot_distance
 
-    @property
+    @cached_property
     def mount_holders_total_length(self) -> float:
         return self.box_outer_length + 2 * self.mount_holder_length
 
-    @property
+    @cached_property
     def mount_holders_fillet_radius(self) -> float:
         return 3.0
 
-    @property
+    @cached_property
     def gasket_slot_depth(self) -> float:
         return self.gasket_height * 2
 
-    @property
+    @cached_property
     def gasket_press_height(self) -> float:
         return self.gasket_height * (1 + self.gasket_compression)
+
+
+_CACHED_PROPERTIES = tuple(
+    name
+    for name, value in vars(EnclosureParameters).items()
+    if isinstance(value, cached_property)
+)
@@ -1,3 +1,7 @@
+from pathlib import Path
+import shutil
+import tempfile
+
 import ocp_vscode as ov
 import cadquery as cq
 from cq_enclosure import Enclosure, ScrewLocation, ScrewType
@@ -5,6 +9,55 @@ from cq_enclosure import Enclosure, ScrewLocation, ScrewType
 
 ov.set_port(3939)
 
+CACHE_DIR = Path.home() / ".cache" / "cq_enclosure"
+PART_NAMES = ("box", "lid", "gasket")
+
+# show rough enclosure shape instead of final parts for faster iteration
+PREVIEW = False
+
+
+def export_brep(part: cq.Workplane, path: Path):
+    part.val().exportBrep(str(path))
+
+
+def build_cached(
+    e: Enclosure,
+) -> tuple[tuple[cq.Workplane, ...], tuple[Path, ...]]:
+    # reuse parts exported by previous run with same parameters
+    cache_dir = CACHE_DIR / e.cache_key()
+    brep_paths = tuple(cache_dir / f"{name}.brep" for name in PART_NAMES)
+    step_paths = tuple(cache_dir / f"{name}.step" for name in PART_NAMES)
+
+    if all(path.exists() for path in brep_paths + step_paths):
+        e.initialize()
+        # brep is native OCCT format, much faster to load than step
+        parts = tuple(
+            cq.Workplane(obj=cq.Shape.importBrep(str(path))) for path in brep_paths
+        )
+        return parts, step_paths
+
+    parts = e.build()
+
+    # write into temporary directory first, interrupted run must not leave partial cache
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_dir = Path(tempfile.mkdtemp(dir=CACHE_DIR))
+    tmp_brep_paths = tuple(tmp_dir / path.name for path in brep_paths)
+    tmp_step_paths = tuple(tmp_dir / path.name for path in step_paths)
+
+    try:
+        for part, brep_path, step_path in zip(parts, tmp_brep_paths, tmp_step_paths):
+            export_brep(part, brep_path)
+            cq.exporters.export(part, str(step_path))
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    # drop incomplete cache left by older code before moving new one in place
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    tmp_dir.rename(cache_dir)
+
+    return parts, step_paths
+
 
 def main():
     e = Enclosure(
@@ -18,30 +71,41 @@ def main():
         middle_length_screws=False,
     )
 
-    box, lid, gasket = e.build()
+    if PREVIEW:
+        shapes = (e.preview(),)
+    else:
+        (box, lid, gasket), paths = build_cached(e)
 
-    #
-    # position objects for visualization
-    #
+        #
+        # position objects for visualization
+        #
 
-    # position lid next to box
-    lid = lid.rotateAboutCenter((1, 0, 0), 180).translate(
-        (e.box_outer_width + 20, 0, -(e.box_outer_height - e.cut_top))
-    )
+        # position lid next to box
+        lid = lid.rotateAboutCenter((1, 0, 0), 180).translate(
+            (e.box_outer_width + 20, 0, -(e.box_outer_height - e.cut_top))
+        )
 
-    gasket = gasket.translate((-(e.box_outer_width + 20), 0, 0))
+        gasket = gasket.translate((-(e.box_outer_width + 20), 0, 0))
+
+        shapes = (box, lid, gasket)
 
     try:
         ov.show(
-            *(box, lid, gasket),
+            *shapes,
             reset_camera=ov.Camera.KEEP,
             colors=["#004400", "#880000", "#000088"],
             black_edges=True,
+            # coarse tessellation is enough for preview
+            deviation=1.0 if PREVIEW else 0.1,
+            angular_tolerance=0.5 if PREVIEW else 0.2,
         )
     finally:
-        cq.exporters.export(box, "enclosure_box.step")
-        cq.exporters.export(lid, "enclosure_lid.step")
-        cq.exporters.export(gasket, "enclosure_gasket.step")
+        if PREVIEW:
+            # full parts are built only for export
+            _, paths = build_cached(e)
+
+        for name, path in zip(PART_NAMES, paths):
+            shutil.copy(path, f"enclosure_{name}.step")
 
 
 if __name__ == "__main__":